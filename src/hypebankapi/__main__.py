@@ -1,4 +1,5 @@
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from getpass import getpass  # For interactive password input
 
 from .banking import Banking
@@ -38,10 +39,15 @@ def main():
 
     # You are now logged in
     try:
-        profile = h.get_profile()
-        balance = h.get_balance()
-        card = h.get_card()
-        movements = h.get_movements(limit=args.limit)
+        # The four requests are independent, so issue them concurrently
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [
+                executor.submit(h.get_profile),
+                executor.submit(h.get_balance),
+                executor.submit(h.get_card),
+                executor.submit(h.get_movements, limit=args.limit),
+            ]
+        profile, balance, card, movements = (f.result() for f in futures)
 
         save_json(profile, 'profile.json')
         save_json(balance, 'balance.json')
@@ -1,11 +1,23 @@
 from abc import ABC, abstractmethod
-import json
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from requests.cookies import RequestsCookieJar
 
 
 from .utils import loginrequired
 
 
+class _LockedCookieJar(RequestsCookieJar):
+    """
+    Cookie jar that also holds its lock while iterating, so that a session
+    can be shared by threads issuing concurrent requests.
+    """
+    def __iter__(self):
+        with self._cookies_lock:
+            return iter(list(super().__iter__()))
+
+
 class Banking(ABC):
     """
     An abstract base class for banking operations.
@@ -84,6 +96,11 @@ class Banking(ABC):
         """
         self.token = None
         self._session = requests.Session()
+        self._session.cookies = _LockedCookieJar()
+        # Keep a small pool of keep-alive connections to the backend so that
+        # consecutive requests do not pay a new TLS handshake each time
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=1)
+        self._session.mount("https://", adapter)
         super().__init__()
 
     def _api_request(self, **kwargs):
@@ -102,12 +119,15 @@ class Banking(ABC):
 
         """
         response = self._session.request(**kwargs)
+        # Read the raw body once: orjson parses bytes directly, and only the
+        # error paths need a (truncated) decoded copy of it
+        body = response.content
         try:
-            data = response.json()
-        except json.decoder.JSONDecodeError:
-            raise self.RequestException("Failed to parse response: " + response.text)
+            data = orjson.loads(body)
+        except orjson.JSONDecodeError:
+            raise self.RequestException("Failed to parse response: " + body[:200].decode(errors="replace"))
         if "responseCode" not in data:
-            raise self.RequestException("Missing response code from response: " + response.text)
+            raise self.RequestException("Missing response code from response: " + body[:200].decode(errors="replace"))
         if data["responseCode"] in ("401", "007"):
             raise self.AuthenticationFailure
         if data["responseCode"] != "200":
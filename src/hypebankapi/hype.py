@@ -1,13 +1,83 @@
+import os
+import re
 import json
+import time
 from datetime import datetime, date
+from pathlib import Path
 from uuid import uuid4
-import requests
+import orjson
 
 
 from .banking import Banking
 from .utils import loginrequired
 
 
+_DEVICE_ID_PATTERN = re.compile(r"[0-9a-f]{32}hype")
+
+
+def _read_device_id(cache_file):
+    """
+    Reads the cached device ID.
+
+    Returns:
+    - str or None: The cached ID, None if the file does not exist, or an
+      empty string if its content is not a valid device ID.
+    """
+    try:
+        device_id = cache_file.read_text(encoding="UTF-8").strip()
+    except FileNotFoundError:
+        return None
+    except ValueError:
+        return ""
+    return device_id if _DEVICE_ID_PATTERN.fullmatch(device_id) else ""
+
+
+def _device_id():
+    """
+    Returns the device ID used for authentication.
+
+    The HYPE_DEVICE_ID environment variable takes precedence. Otherwise the ID
+    is generated once and cached in $XDG_CACHE_HOME/hypeapi/device_id
+    (~/.cache/hypeapi/device_id by default), readable only by the owner, so
+    that the backend sees the same device across runs. If the cache cannot be
+    used, a fresh ID is returned for the current process.
+    """
+    device_id = os.environ.get("HYPE_DEVICE_ID")
+    if device_id:
+        return device_id
+    device_id = uuid4().hex + "hype"
+    try:
+        xdg_cache = os.environ.get("XDG_CACHE_HOME")
+        if xdg_cache and os.path.isabs(xdg_cache):
+            cache_dir = Path(xdg_cache)
+        else:
+            cache_dir = Path.home() / ".cache"
+        cache_file = cache_dir / "hypeapi" / "device_id"
+        cached = _read_device_id(cache_file)
+        if cached:
+            return cached
+        if cached is not None:
+            # Corrupted cache: replace it with a fresh ID
+            cache_file.unlink()
+        cache_file.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        try:
+            fd = os.open(cache_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        except FileExistsError:
+            # Another process created the cache first: wait for its ID
+            for _ in range(10):
+                cached = _read_device_id(cache_file)
+                if cached:
+                    return cached
+                time.sleep(0.01)
+            return device_id
+        with os.fdopen(fd, "w", encoding="UTF-8") as outfile:
+            outfile.write(device_id)
+    except (OSError, RuntimeError, ValueError):
+        # No usable cache (e.g. no home directory): the ID lasts for this run
+        pass
+    return device_id
+
+
 class Hype(Banking):
     """
     A class for interacting with the Hype banking API.
@@ -19,7 +89,7 @@ class Hype(Banking):
     - CARD_URL (str): The URL for retrieving the user's card information.
     - MOVEMENTS_URL (str): The URL for retrieving the user's recent movements.
     - APP_VERSION (str): The version of the Hype mobile app.
-    - DEVICE_ID (str): The unique device ID used for authentication.
+    - DEVICE_ID (str): The unique device ID used for authentication, persisted across runs.
     - DEVICE_INFO (str): JSON string containing device information.
 
     Methods:
@@ -39,7 +109,7 @@ class Hype(Banking):
     CARD_URL = "https://api.hype.it/v1/rest/your/card"
     MOVEMENTS_URL = "https://api.hype.it/v1/rest/m/last/{}"
     APP_VERSION = "5.1.6"
-    DEVICE_ID = str(uuid4()).replace("-", "") + "hype"
+    DEVICE_ID = _device_id()
     DEVICE_INFO = json.dumps({
         "jailbreak": "false",
         "osversion": "13.3.1",
@@ -92,9 +162,10 @@ class Hype(Banking):
             timeout=10
         )
         try:
-            if enroll1.json()["Check"] != "OK":
+            data = orjson.loads(enroll1.content)
+            if data["Check"] != "OK":
                 raise self.AuthenticationError("Login failed")
-        except json.decoder.JSONDecodeError:
+        except orjson.JSONDecodeError:
             raise self.AuthenticationError(
                 "Failed to parse response for login request")
         except KeyError:
@@ -110,16 +181,17 @@ class Hype(Banking):
             timeout=10
         )
         try:
-            if enroll2.json()["ErrorMessage"] != "":
+            data = orjson.loads(enroll2.content)
+            if data["ErrorMessage"] != "":
                 raise self.AuthenticationError(
-                    "Server returned error: " + enroll2.json()["ErrorMessage"])
-        except json.decoder.JSONDecodeError:
+                    "Server returned error: " + data["ErrorMessage"])
+        except orjson.JSONDecodeError:
             raise self.RequestException(
                 "Failed to parse response for bioToken request")
         except KeyError:
             raise self.AuthenticationError(
                 "Missing data in response for bioToken request")
-        self.bin = enroll2.json()["Bin"]
+        self.bin = data["Bin"]
         self._username = username
 
     def otp2fa(self, code):
@@ -149,19 +221,20 @@ class Hype(Banking):
             timeout=10
         )
         try:
-            if otp.json()["Check"] != "OK":
+            data = orjson.loads(otp.content)
+            if data["Check"] != "OK":
                 raise self.AuthenticationError(
                     "OTP verification failed. Please login() again")
-        except json.decoder.JSONDecodeError:
+        except orjson.JSONDecodeError:
             raise self.RequestException(
                 "Failed to parse response for OTP verification request")
         except KeyError:
             raise self.AuthenticationError(
                 "OTP verification failed. Please login() again")
-        self.checksum = otp.json()["Checksum"]
+        self.checksum = data["Checksum"]
         self.token = self._session.cookies.get_dict()["token"]
         self.newids = self._session.cookies.get_dict()["newids"]
-        self._session = requests.Session()
+        self._session.cookies.clear()
         self._session.headers.update({
             "hype_token": self.token,
             "newids": self.newids,
@@ -190,9 +263,10 @@ class Hype(Banking):
             timeout=10
         )
         try:
-            if renewal.json()["Check"] != "OK":
+            data = orjson.loads(renewal.content)
+            if data["Check"] != "OK":
                 raise self.AuthenticationError("Renewal failed")
-        except json.decoder.JSONDecodeError:
+        except orjson.JSONDecodeError:
             raise self.AuthenticationError(
                 "Failed to parse response for renewal request")
         except KeyError:
@@ -208,10 +282,11 @@ class Hype(Banking):
             timeout=10
         )
         try:
-            if reenroll.json()["ErrorMessage"] != "":
+            data = orjson.loads(reenroll.content)
+            if data["ErrorMessage"] != "":
                 raise self.AuthenticationError(
-                    "Server returned error: " + reenroll.json()["ErrorMessage"])
-        except json.decoder.JSONDecodeError:
+                    "Server returned error: " + data["ErrorMessage"])
+        except orjson.JSONDecodeError:
             raise self.RequestException(
                 "Failed to parse response for bioToken request")
         except KeyError:
@@ -219,13 +294,13 @@ class Hype(Banking):
                 "Missing data in response for bioToken request")
         self.token = self._session.cookies.get_dict()["token"]
         self.newids = self._session.cookies.get_dict()["newids"]
-        self._session = requests.Session()
+        self._session.cookies.clear()
         self._session.headers.update({
             "hype_token": self.token,
             "newids": self.newids,
             "App-Version": self.APP_VERSION
         })
-        self.bin = reenroll.json()["Bin"]
+        self.bin = data["Bin"]
 
     @loginrequired
     def get_movements(self, limit=5):
@@ -1,5 +1,5 @@
 import os
-import json
+import orjson
 from lxml import html
 
 
@@ -42,6 +42,6 @@ def save_json(json_data, json_filename: str = 'info.json'):
     if not os.path.isdir('json'):
         os.mkdir('json')
 
-    with open(f"json{os.sep}{json_filename}", 'w', encoding='UTF-8') as outfile:
-        json.dump(json_data, outfile)
+    with open(f"json{os.sep}{json_filename}", 'wb') as outfile:
+        outfile.write(orjson.dumps(json_data, option=orjson.OPT_INDENT_2))
     return True